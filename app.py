@@ -7,6 +7,7 @@ import time
 from utils import generate_test_data, load_data_from_file, manual_input_flow
 from sa import simulated_annealing
 from ga import genetic_algorithm
+from tabu import tabu_search
 
 from models import Package, Vehicle
 
@@ -136,7 +137,7 @@ data_source = st.sidebar.radio(
 
 
 # Algorithm selector
-algo_choice = st.sidebar.radio(" Algorithm", ["Simulated Annealing", "Genetic Algorithm"], key="algo_choice")
+algo_choice = st.sidebar.radio(" Algorithm", ["Simulated Annealing", "Genetic Algorithm", "Tabu Search"], key="algo_choice")
 
 
 # ===== ADD THE GUARD RIGHT HERE =====
@@ -234,6 +235,12 @@ if algo_choice == "Genetic Algorithm":
     population_size = st.sidebar.slider("Population Size", 20, 300, 80, step=10, key="ga_pop")
     mutation_rate   = st.sidebar.slider("Mutation Rate", 0.01, 0.30, 0.05, step=0.01, format="%.2f", key="ga_mut")
     generations     = st.sidebar.slider("Generations", 100, 2000, 500, step=100, key="ga_gen")
+    reject_dupes    = st.sidebar.checkbox("Reject Duplicate Solutions", value=False, key="ga_dupes")
+elif algo_choice == "Tabu Search":
+    st.sidebar.markdown("### ️ Tabu Parameters")
+    tabu_tenure     = st.sidebar.slider("Tabu Tenure", 1, 50, 10, step=1, key="ts_tenure")
+    ts_iterations   = st.sidebar.slider("Iterations", 100, 2000, 500, step=100, key="ts_iter")
+    time_limit      = st.sidebar.slider("Time Limit (s)", 1, 60, 10, step=1, key="ts_time")
 else:  # Simulated Annealing
     st.sidebar.markdown("### ️ SA Parameters")
     cool_rate = st.sidebar.slider("Cooling Rate", 0.90, 0.99, 0.95, step=0.01, key="sa_cool")
@@ -248,8 +255,10 @@ if st.button(" Start Optimization"):
     with st.spinner("Optimizing..."):
         if algo_choice == "Simulated Annealing":
             solution = simulated_annealing(pkgs, vehs, initial_temp, cool_rate, stop_temp, iter_temp)
+        elif algo_choice == "Tabu Search":
+            solution = tabu_search(pkgs, vehs, tabu_tenure, ts_iterations, time_limit)
         else:
-            solution = genetic_algorithm(pkgs, vehs, population_size, mutation_rate, generations)
+            solution = genetic_algorithm(pkgs, vehs, population_size, mutation_rate, generations, reject_duplicates=reject_dupes)
 
     #  Results summary
     st.success(f"Optimization complete using **{algo_choice}**")
@@ -1,8 +1,23 @@
 import random
+from collections import OrderedDict
 from copy import deepcopy
 from models import Vehicle, DeliverySolution
 
-def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05, generations=500):
+def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05, generations=500, memo_size=5000, reject_duplicates=False):
+
+    # Bounded LRU memo of solution signature -> total distance
+    memo = OrderedDict()
+
+    def fitness(sol):
+        key = sol.signature()
+        if key in memo:
+            memo.move_to_end(key)
+            return memo[key]
+        d = sol.total_distance()
+        memo[key] = d
+        if len(memo) > memo_size:
+            memo.popitem(last=False)
+        return d
 
     # Attempt-limited initial solution generator
     def create_solution(max_attempts=100):
@@ -66,7 +81,7 @@ def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05
     def pick_parents(pop):
         weights = []
         for sol in pop:
-            d = sol.total_distance()
+            d = fitness(sol)
             if d > 0:
                 weights.append(1 / d)
             else:
@@ -75,10 +90,11 @@ def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05
 
     # === Main Genetic Algorithm Loop ===
     population = [create_solution() for _ in range(population_size)]
-    best = min(population, key=lambda sol: sol.total_distance())
+    best = min(population, key=fitness)
 
     for gen in range(generations):
         new_pop = []
+        seen = set()
         for _ in range(population_size):
             p1, p2 = pick_parents(population)
             child = crossover(p1, p2)
@@ -87,6 +103,12 @@ def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05
                 mutate(child)
 
             if child.is_valid() and sum(len(v.packages) for v in child.vehicles) > 0:
+                # Optionally drop equivalent assignments to preserve diversity
+                if reject_duplicates:
+                    key = child.signature()
+                    if key in seen:
+                        continue
+                    seen.add(key)
                 new_pop.append(child)
 
         # Ensure population is not empty
@@ -96,12 +118,12 @@ def genetic_algorithm(packages, vehicles, population_size=80, mutation_rate=0.05
             population = population[:]  # retain previous generation
 
         # Track the best solution
-        best_candidate = min(population, key=lambda sol: sol.total_distance())
-        if best_candidate.total_distance() < best.total_distance():
+        best_candidate = min(population, key=fitness)
+        if fitness(best_candidate) < fitness(best):
             best = best_candidate
 
         if gen % 50 == 0:
-            print(f"Generation {gen} | Best Distance: {best.total_distance():.2f} km")
+            print(f"Generation {gen} | Best Distance: {fitness(best):.2f} km")
 
     all_assigned_ids = {p.id for v in best.vehicles for p in v.packages}
     all_input_ids = {p.id for p in packages}
@@ -50,6 +50,10 @@ class DeliverySolution:
     def clone(self):
         return deepcopy(self)
 
+    def signature(self):
+        # Canonical key: vehicle-to-packages assignment and route order, independent of vehicle list order
+        return tuple(sorted((v.id, tuple(p.id for p in v.packages)) for v in self.vehicles))
+
     def __repr__(self):
         return f"\nTotal Distance: {self.total_distance():.2f} km\n" + "\n".join(str(v) for v in sorted(self.vehicles, key=lambda v: v.id))
 
@@ -0,0 +1,135 @@
+import random
+import time
+from models import DeliverySolution, Vehicle, euclidean
+
+DEPOT = (0, 0)
+
+def tabu_search(packages, vehicles, tabu_tenure=10, iterations=500, time_limit=None):
+
+    def make_initial_solution():
+        sorted_pkgs = sorted(packages, key=lambda p: p.priority)
+        vehicles_copy = [Vehicle(v.id, v.capacity) for v in vehicles]
+
+        for pkg in sorted_pkgs:
+            random.shuffle(vehicles_copy)
+            for v in vehicles_copy:
+                if v.can_add(pkg):
+                    v.packages.append(pkg)
+                    break
+
+        return DeliverySolution(vehicles_copy)
+
+    # Coordinate of the stop before / after position idx (depot at both ends)
+    def stop(v, idx):
+        if idx < 0 or idx >= len(v.packages):
+            return DEPOT
+        return v.packages[idx].destination()
+
+    # Distance saved by taking the package at idx out of the route
+    def removal_gain(v, idx):
+        prev, cur, nxt = stop(v, idx - 1), stop(v, idx), stop(v, idx + 1)
+        return euclidean(prev, cur) + euclidean(cur, nxt) - euclidean(prev, nxt)
+
+    # Cheapest position to insert pkg into v (ignoring package at skip_idx)
+    def best_insertion(v, pkg, skip_idx=None):
+        coords = [p.destination() for i, p in enumerate(v.packages) if i != skip_idx]
+        coords = [DEPOT] + coords + [DEPOT]
+        dest = pkg.destination()
+        best_pos, best_cost = 0, float("inf")
+        for k in range(len(coords) - 1):
+            cost = euclidean(coords[k], dest) + euclidean(dest, coords[k + 1]) - euclidean(coords[k], coords[k + 1])
+            if cost < best_cost:
+                best_pos, best_cost = k, cost
+        return best_pos, best_cost
+
+    # Cost change of replacing the package at idx with pkg in place
+    def replace_delta(v, idx, pkg):
+        prev, nxt = stop(v, idx - 1), stop(v, idx + 1)
+        old, new = stop(v, idx), pkg.destination()
+        return (euclidean(prev, new) + euclidean(new, nxt)) - (euclidean(prev, old) + euclidean(old, nxt))
+
+    # All feasible relocate and swap moves between vehicles a and b
+    def evaluate_pair(sol, a, b):
+        va, vb = sol.vehicles[a], sol.vehicles[b]
+        load_a, load_b = va.current_load(), vb.current_load()
+        moves = []
+
+        for src, dst, vs, vd, load_d in ((a, b, va, vb, load_b), (b, a, vb, va, load_a)):
+            for i, pkg in enumerate(vs.packages):
+                if load_d + pkg.weight > vd.capacity:
+                    continue
+                pos, ins_cost = best_insertion(vd, pkg)
+                delta = ins_cost - removal_gain(vs, i)
+                moves.append((delta, ("relocate", src, i, dst, pos), ((pkg.id, vd.id),)))
+
+        for i, pa in enumerate(va.packages):
+            for j, pb in enumerate(vb.packages):
+                if load_a - pa.weight + pb.weight > va.capacity:
+                    continue
+                if load_b - pb.weight + pa.weight > vb.capacity:
+                    continue
+                delta = replace_delta(va, i, pb) + replace_delta(vb, j, pa)
+                moves.append((delta, ("swap", a, i, b, j), ((pa.id, vb.id), (pb.id, va.id))))
+
+        return moves
+
+    # Apply a move in place and return the tabu attributes it creates
+    def apply_move(sol, move):
+        kind, a, i, b, j = move
+        va, vb = sol.vehicles[a], sol.vehicles[b]
+        if kind == "relocate":
+            pkg = va.packages.pop(i)
+            vb.packages.insert(j, pkg)
+            return [(pkg.id, va.id)]
+        pa, pb = va.packages[i], vb.packages[j]
+        va.packages[i], vb.packages[j] = pb, pa
+        return [(pa.id, va.id), (pb.id, vb.id)]
+
+    # === Main Tabu Search Loop ===
+    current_sol = make_initial_solution()
+    current_cost = current_sol.total_distance()
+    best_sol = current_sol.clone()
+    best_cost = current_cost
+
+    n = len(current_sol.vehicles)
+    pairs = [(a, b) for a in range(n) for b in range(a + 1, n)]
+    move_table = {pair: evaluate_pair(current_sol, *pair) for pair in pairs}
+    tabu = {}
+    start = time.time()
+
+    for it in range(iterations):
+        if time_limit is not None and time.time() - start > time_limit:
+            break
+
+        chosen, chosen_delta = None, float("inf")
+        for pair_moves in move_table.values():
+            for delta, move, attrs in pair_moves:
+                if delta >= chosen_delta:
+                    continue
+                is_tabu = any(tabu.get(attr, -1) > it for attr in attrs)
+                # Aspiration: a tabu move is allowed if it beats the best so far
+                if is_tabu and current_cost + delta >= best_cost - 1e-9:
+                    continue
+                chosen, chosen_delta = move, delta
+
+        if chosen is None:
+            break
+
+        for attr in apply_move(current_sol, chosen):
+            tabu[attr] = it + tabu_tenure
+        current_cost += chosen_delta
+
+        # Only moves touching the two changed routes need re-evaluation
+        changed = (chosen[1], chosen[3])
+        for pair in pairs:
+            if pair[0] in changed or pair[1] in changed:
+                move_table[pair] = evaluate_pair(current_sol, *pair)
+
+        if current_cost < best_cost - 1e-9:
+            best_cost = current_cost
+            best_sol = current_sol.clone()
+
+        if it % 50 == 0:
+            print(f"Iteration {it} | Best Distance: {best_cost:.2f} km")
+
+    return best_sol